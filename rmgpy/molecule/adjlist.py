@@ -76,7 +76,7 @@ class Saturator(object):
 
             for _ in range(number_of_h_to_be_added):
                 a = Atom(element='H', radical_electrons=0, charge=0, label='', lone_pairs=0)
-                b = Bond(atom, a, 'S')
+                b = Bond(atom, a, 1)
                 new_atoms.append(a)
                 atom.bonds[a] = b
                 a.bonds[atom] = b
@@ -419,7 +419,7 @@ def from_old_adjacency_list(adjlist, group=False, saturate_h=False):
                             atom.lone_pairs - PeriodicSystem.lone_pairs[atom.symbol])
                     for i in range(count):
                         a = Atom(element='H', radical_electrons=0, charge=0, label='', lone_pairs=0)
-                        b = Bond(atom, a, 'S')
+                        b = Bond(atom, a, 1)
                         new_atoms.append(a)
                         atom.bonds[a] = b
                         a.bonds[atom] = b
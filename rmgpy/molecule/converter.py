@@ -48,6 +48,15 @@ import rmgpy.molecule.element as elements
 import rmgpy.molecule.molecule as mm
 from rmgpy.exceptions import DependencyError
 
+# RMG bond orders for the RDKit bond types, used when reading RDKit molecules
+RDKIT_BOND_ORDERS = {
+    Chem.rdchem.BondType.SINGLE: 1,
+    Chem.rdchem.BondType.DOUBLE: 2,
+    Chem.rdchem.BondType.TRIPLE: 3,
+    Chem.rdchem.BondType.QUADRUPLE: 4,
+    Chem.rdchem.BondType.AROMATIC: 1.5,
+}
+
 
 def to_rdkit_mol(mol, remove_h=True, return_mapping=False, sanitize=True, save_order=False):
     """
@@ -65,7 +74,10 @@ def to_rdkit_mol(mol, remove_h=True, return_mapping=False, sanitize=True, save_o
         mol.sort_atoms()
     atoms = mol.vertices
     rd_atom_indices = {}  # dictionary of RDKit atom indices
+    # Positions of all atoms, keyed by id() since Atom.__hash__ only hashes the element symbol
+    atom_indices = {}
     label_dict = {} # store label of atom for Framgent
+    has_hydrogens = False  # whether there are any hydrogen atoms for RDKit to remove
     rdkitmol = Chem.rdchem.EditableMol(Chem.rdchem.Mol())
     for index, atom in enumerate(mol.vertices):
         if atom.element.symbol == 'X':
@@ -79,8 +91,9 @@ def to_rdkit_mol(mol, remove_h=True, return_mapping=False, sanitize=True, save_o
         if atom.element.symbol == 'C' and atom.lone_pairs == 1 and mol.multiplicity == 1: rd_atom.SetNumRadicalElectrons(
             2)
         rdkitmol.AddAtom(rd_atom)
+        atom_indices[id(atom)] = index
         if remove_h and atom.symbol == 'H':
-            pass
+            has_hydrogens = True
         else:
             rd_atom_indices[atom] = index
 
@@ -99,12 +112,11 @@ def to_rdkit_mol(mol, remove_h=True, return_mapping=False, sanitize=True, save_o
     orders = {'S': rd_bonds.SINGLE, 'D': rd_bonds.DOUBLE, 'T': rd_bonds.TRIPLE, 'B': rd_bonds.AROMATIC,
               'Q': rd_bonds.QUADRUPLE}
     # Add the bonds
-    for atom1 in mol.vertices:
+    for index1, atom1 in enumerate(atoms):
         for atom2, bond in atom1.edges.items():
             if bond.is_hydrogen_bond():
                 continue
-            index1 = atoms.index(atom1)
-            index2 = atoms.index(atom2)
+            index2 = atom_indices[id(atom2)]
             if index1 < index2:
                 order_string = bond.get_order_str()
                 order = orders[order_string]
@@ -121,7 +133,9 @@ def to_rdkit_mol(mol, remove_h=True, return_mapping=False, sanitize=True, save_o
             atom.SetNoImplicit(True)
     if sanitize:
         Chem.SanitizeMol(rdkitmol)
-    if remove_h:
+    # RemoveHs copies the whole molecule, so skip it when there is nothing to remove
+    # (unsanitized molecules are still passed through it, so their handling is unchanged)
+    if remove_h and (has_hydrogens or not sanitize):
         rdkitmol = Chem.RemoveHs(rdkitmol, sanitize=sanitize)
     if return_mapping:
         return rdkitmol, rd_atom_indices
@@ -168,27 +182,15 @@ def from_rdkit_mol(mol, rdkitmol, raise_atomtype_exception=True):
         atom = mm.Atom(element, radical_electrons, charge, '', 0)
         mol.vertices.append(atom)
 
-        # Add bonds by iterating again through atoms
-        for j in range(0, i):
-            rdkitbond = rdkitmol.GetBondBetweenAtoms(i, j)
-            if rdkitbond is not None:
-                order = 0
-
-                # Process bond type
-                rdbondtype = rdkitbond.GetBondType()
-                if rdbondtype.name == 'SINGLE':
-                    order = 1
-                elif rdbondtype.name == 'DOUBLE':
-                    order = 2
-                elif rdbondtype.name == 'TRIPLE':
-                    order = 3
-                elif rdbondtype.name == 'QUADRUPLE':
-                    order = 4
-                elif rdbondtype.name == 'AROMATIC':
-                    order = 1.5
-
-                bond = mm.Bond(mol.vertices[i], mol.vertices[j], order)
-                mol.add_bond(bond)
+    # iterate through bonds in rdkitmol
+    for rdkitbond in rdkitmol.GetBonds():
+        # Process bond type
+        order = RDKIT_BOND_ORDERS.get(rdkitbond.GetBondType(), 0)
+
+        bond = mm.Bond(mol.vertices[rdkitbond.GetBeginAtomIdx()],
+                       mol.vertices[rdkitbond.GetEndAtomIdx()],
+                       order)
+        mol.add_bond(bond)
 
     # We need to update lone pairs first because the charge was set by RDKit
     mol.update_lone_pairs()
@@ -245,8 +247,9 @@ def to_ob_mol(mol, return_mapping=False, save_order=False):
     atoms = mol.vertices
 
     ob_atom_ids = {}  # dictionary of OB atom IDs
+    atom_indices = {}  # positions of all atoms, keyed by id() as in to_rdkit_mol
     obmol = openbabel.OBMol()
-    for atom in atoms:
+    for index, atom in enumerate(atoms):
         a = obmol.NewAtom()
         if atom.element.symbol == 'X':
             a.SetAtomicNum(78)  # not sure how to do this with linear scaling when this might not be Pt
@@ -257,13 +260,13 @@ def to_ob_mol(mol, return_mapping=False, save_order=False):
         a.SetFormalCharge(atom.charge)
         # a.SetImplicitHCount(0) # the default is 0
         ob_atom_ids[atom] = a.GetId()
+        atom_indices[id(atom)] = index
     orders = {1: 1, 2: 2, 3: 3, 4: 4, 1.5: 5}
-    for atom1 in mol.vertices:
+    for index1, atom1 in enumerate(atoms):
         for atom2, bond in atom1.edges.items():
             if bond.is_hydrogen_bond():
                 continue
-            index1 = atoms.index(atom1)
-            index2 = atoms.index(atom2)
+            index2 = atom_indices[id(atom2)]
             if index1 < index2:
                 order = orders[bond.order]
                 obmol.AddBond(index1 + 1, index2 + 1, order)
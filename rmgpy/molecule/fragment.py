@@ -46,6 +46,10 @@ ATOM_ID_COUNTER = -(2**15)
 
 
 class CuttingLabel(Atom):
+    # Atom is an extension type with fixed attributes; declaring the extra
+    # ones here keeps CuttingLabel instances from carrying a __dict__
+    __slots__ = ('name', 'isotope')
+
     def __init__(self, name="", label="", id=-1):
         super().__init__(
             element=Element(0, name, "cutting label", 0.0, -1),
@@ -713,10 +717,11 @@ class Fragment(Molecule):
                 H = Atom("H", radical_electrons=0, lone_pairs=0, charge=0)
                 bond = Bond(atom, H, 1)
                 self.add_atom(H)
-                self.add_bond(bond)
-                if atom not in added:
-                    added[atom] = []
-                added[atom].append([H, bond])
+                # Connect the new hydrogen directly, since add_bond would scan
+                # the atom list for both atoms of every new bond
+                atom.edges[H] = bond
+                H.edges[atom] = bond
+                added.setdefault(atom, []).append([H, bond])
                 atom.decrement_radical()
 
         # Update the atom types of the saturated structure (not sure why
@@ -848,12 +853,14 @@ class Fragment(Molecule):
         size_threshold is the minimum size for each aliphatic fragment size. Default value is 5.
         """
         mol = self.generate_resonance_structures()[0]
+        # converting to SMILES is a full RDKit/OpenBabel round trip, so only do it once
+        mol_smiles = mol.to_smiles()
 
         # slice mol
         frag_smiles_list = []
         if cut_through:
             arom_cut_frag = self.sliceitup_arom(
-                mol.to_smiles(), size_threshold=size_threshold
+                mol_smiles, size_threshold=size_threshold
             )
             for frag in arom_cut_frag:
                 aliph_cut_frag = self.sliceitup_aliph(
@@ -866,16 +873,16 @@ class Fragment(Molecule):
             if mol.is_aromatic():
                 # try aromatic cut first, if no cut found, try aliphatic cut then
                 frag_smiles_list = self.sliceitup_arom(
-                    mol.to_smiles(), size_threshold=size_threshold
+                    mol_smiles, size_threshold=size_threshold
                 )
                 if len(frag_smiles_list) == 1:
                     # try aliphatic cut then
                     frag_smiles_list = self.sliceitup_aliph(
-                        mol.to_smiles(), size_threshold=size_threshold
+                        mol_smiles, size_threshold=size_threshold
                     )
             else:
                 frag_smiles_list = self.sliceitup_aliph(
-                    mol.to_smiles(), size_threshold=size_threshold
+                    mol_smiles, size_threshold=size_threshold
                 )
 
         if output_smiles:
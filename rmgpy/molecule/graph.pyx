@@ -287,7 +287,9 @@ cdef class Graph(object):
         Returns ``True`` if vertices `vertex1` and `vertex2` are connected
         by an edge, or ``False`` if not.
         """
-        return vertex1 in self.vertices and vertex2 in vertex1.edges
+        # Check the vertex's own edge dictionary first so that the linear scan
+        # of the vertex list is only needed when the edge actually exists
+        return vertex2 in vertex1.edges and vertex1 in self.vertices
 
     cpdef remove_vertex(self, Vertex vertex):
         """
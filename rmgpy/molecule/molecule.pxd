@@ -35,6 +35,8 @@ from rmgpy.molecule.graph cimport Vertex, Edge, Graph
 
 ################################################################################
 cdef dict bond_orders 
+cdef double bond_order_tolerance
+cdef dict bond_symbols
 
 cdef class Atom(Vertex):
 
@@ -61,10 +61,18 @@ from rmgpy.molecule.pathfinder import find_shortest_path
 
 ################################################################################
 
-bond_orders = {'S': 1, 'D': 2, 'T': 3, 'B': 1.5}
+bond_orders = {'S': 1, 'D': 2, 'T': 3, 'B': 1.5, 'Q': 4, 'vdW': 0, 'H': 0.1, 'R': 0.05}
+
+# Absolute tolerance used when comparing bond orders
+bond_order_tolerance = 1e-4
+
+# Symbols used by Bond.get_bond_string for each bond order
+bond_symbols = {0.05: '~', 0.1: '~', 1: '-', 1.5: ':', 2: '=', 3: '#'}
 
 globals().update({
     'bond_orders': bond_orders,
+    'bond_order_tolerance': bond_order_tolerance,
+    'bond_symbols': bond_symbols,
 })
 
 
@@ -119,11 +127,9 @@ class Atom(Vertex):
         """
         Return a human-readable string representation of the object.
         """
-        return '{0}{1}{2}'.format(
-            str(self.element),
-            '.' * self.radical_electrons,
-            '+' * self.charge if self.charge > 0 else '-' * -self.charge,
-        )
+        cython.declare(charge=cython.short)
+        charge = self.charge
+        return str(self.element) + '.' * self.radical_electrons + ('+' * charge if charge > 0 else '-' * -charge)
 
     def __repr__(self):
         """
@@ -699,13 +705,16 @@ class Bond(Edge):
         ``False`` otherwise. `other` can be either a :class:`Bond` or a
         :class:`GroupBond` object.
         """
-        cython.declare(bond=Bond, bp=gr.GroupBond)
+        cython.declare(bond=Bond, bp=gr.GroupBond, other_order=cython.float)
         if isinstance(other, Bond):
             bond = other
-            return self.is_order(bond.get_order_num())
+            return abs(self.order - bond.order) <= bond_order_tolerance
         elif isinstance(other, gr.GroupBond):
             bp = other
-            return any([self.is_order(otherOrder) for otherOrder in bp.get_order_num()])
+            for other_order in bp.order:
+                if self.is_order(other_order):
+                    return True
+            return False
 
     def is_specific_case_of(self, other):
         """
@@ -743,23 +752,9 @@ class Bond(Edge):
         """
         set the bond order using a valid bond-order character
         """
-        if new_order == 'S':
-            self.order = 1
-        elif new_order == 'D':
-            self.order = 2
-        elif new_order == 'T':
-            self.order = 3
-        elif new_order == 'B':
-            self.order = 1.5
-        elif new_order == 'Q':
-            self.order = 4
-        elif new_order == 'vdW':
-            self.order = 0
-        elif new_order == 'H':
-            self.order = 0.1
-        elif new_order == 'R':
-            self.order = 0.05
-        else:
+        try:
+            self.order = bond_orders[new_order]
+        except KeyError:
             # try to see if an float disguised as a string was input by mistake
             try:
                 self.order = float(new_order)
@@ -808,7 +803,7 @@ class Bond(Edge):
         NOTE: we can replace the absolute value relation with math.isclose when
         we swtich to python 3.5+
         """
-        return abs(self.order - other_order) <= 1e-4
+        return abs(self.order - other_order) <= bond_order_tolerance
 
     def is_single(self):
         """
@@ -917,16 +912,15 @@ class Bond(Edge):
         the atom labels in alphabetical order (i.e. 'C-H' is possible but not 'H-C')
         :return: str
         """
-        bond_symbol_mapping = {0.05: '~', 0.1: '~', 1: '-', 1.5: ':', 2: '=', 3: '#'}
         atom_labels = [self.atom1.symbol, self.atom2.symbol]
         atom_labels.sort()
         try:
-            bond_symbol = bond_symbol_mapping[self.get_order_num()]
+            bond_symbol = bond_symbols[self.get_order_num()]
         except KeyError:
             # Direct lookup didn't work, but before giving up try
             # with the is_order() method which allows a little latitude
             # for floating point errors.
-            for order, symbol in bond_symbol_mapping.items():
+            for order, symbol in bond_symbols.items():
                 if self.is_order(order):
                     bond_symbol = symbol
                     break
@@ -1217,7 +1211,9 @@ class Molecule(Graph):
             if vertex.sorting_label < 0:
                 self.update_connectivity_values()
                 break
-        self.atoms.sort(reverse=True)
+        # Evaluate each atom's sorting key (element, Morgan connectivity value,
+        # electrons) once, instead of twice per comparison via Atom.__lt__
+        self.atoms.sort(key=lambda atom: atom.sorting_key, reverse=True)
         for index, vertex in enumerate(self.vertices):
             vertex.sorting_label = index
 
@@ -1376,21 +1372,32 @@ class Molecule(Graph):
         connectivity values. If there's nothing but hydrogens, it does nothing.
         It destroys information; be careful with it.
         """
-        cython.declare(atom=Atom, hydrogens=list)
-        # Check that the structure contains at least one heavy atom
-        for atom in self.vertices:
-            if not atom.is_hydrogen():
-                break
-        else:
-            # No heavy atoms, so leave explicit
-            return
+        cython.declare(atom=Atom, atom2=Atom, hydrogens=list, remaining=list, has_heavy_atom=cython.bint)
+        # Find the unlabeled hydrogens and check for a heavy atom in a single pass
+        has_heavy_atom = False
         hydrogens = []
+        remaining = []
         for atom in self.vertices:
-            if atom.is_hydrogen() and atom.label == '':
+            if atom.element.number != 1:
+                has_heavy_atom = True
+                remaining.append(atom)
+            elif atom.label == '':
                 hydrogens.append(atom)
-        # Remove the hydrogen atoms from the structure
+            else:
+                remaining.append(atom)
+        if not has_heavy_atom:
+            # No heavy atoms, so leave explicit
+            return
+        if not hydrogens:
+            return
+        # Detach the hydrogen atoms from their neighbors, then drop them from
+        # the atom list all at once rather than removing them one at a time
+        self._fingerprint = self._inchi = self._smiles = None
         for atom in hydrogens:
-            self.remove_atom(atom)
+            for atom2 in atom.edges:
+                del atom2.edges[atom]
+            atom.edges = dict()
+        self.vertices[:] = remaining
 
     def connect_the_dots(self, critical_distance_factor=0.45, raise_atomtype_exception=True):
         """
@@ -1552,6 +1559,9 @@ class Molecule(Graph):
         if not isinstance(other, Graph):
             raise TypeError(
                 'Got a {0} object for parameter "other", when a Molecule object is required.'.format(other.__class__))
+        # A molecule is trivially isomorphic to itself unless a mapping was requested
+        if other is self and not initial_map and not generate_initial_map:
+            return True
         # Do the quick isomorphism comparison using the fingerprint
         # Two fingerprint strings matching is a necessary (but not
         # sufficient!) condition for the associated molecules to be isomorphic
@@ -2337,6 +2347,7 @@ class Molecule(Graph):
 
         saturator = Saturator()
         saturator.saturate(self.atoms)
+        self._fingerprint = self._inchi = self._smiles = None
         if update: self.update()
 
     def saturate_radicals(self, raise_atomtype_exception=True):
@@ -2350,10 +2361,11 @@ class Molecule(Graph):
                 H = Atom('H', radical_electrons=0, lone_pairs=0, charge=0)
                 bond = Bond(atom, H, 1)
                 self.add_atom(H)
-                self.add_bond(bond)
-                if atom not in added:
-                    added[atom] = []
-                added[atom].append([H, bond])
+                # Connect the new hydrogen directly, since add_bond would scan
+                # the atom list for both atoms of every new bond
+                atom.edges[H] = bond
+                H.edges[atom] = bond
+                added.setdefault(atom, []).append([H, bond])
                 atom.decrement_radical()
 
         # Update the atom types of the saturated structure (not sure why
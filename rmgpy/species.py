@@ -304,7 +304,13 @@ class Species(object):
             save_order (bool, optional):           if ``True``, reset atom order after performing atom isomorphism
             strict (bool, optional):               If ``False``, perform isomorphism ignoring electrons.
         """
+        if other is self and self.molecule and not generate_initial_map:
+            return True
+        # All resonance structures share a molecular formula, so compare the
+        # fingerprints once before checking each pair of structures
         if isinstance(other, Molecule) or isinstance(other, Fragment):
+            if self.molecule and self.molecule[0].fingerprint != other.fingerprint:
+                return False
             for molecule in self.molecule:
                 if molecule.is_isomorphic(other, generate_initial_map=generate_initial_map,
                                           save_order=save_order, strict=strict):
@@ -312,6 +318,8 @@ class Species(object):
                 elif not strict:
                     return False
         elif isinstance(other, Species):
+            if self.molecule and other.molecule and self.molecule[0].fingerprint != other.molecule[0].fingerprint:
+                return False
             for molecule1 in self.molecule:
                 for molecule2 in other.molecule:
                     if molecule1.is_isomorphic(molecule2, generate_initial_map=generate_initial_map,
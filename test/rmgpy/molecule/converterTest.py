@@ -134,6 +134,38 @@ class RDKitTest:
         assert [atom.number for atom in mol.atoms] == [1, 6, 7]
         assert [rdkitmol.GetAtomWithIdx(idx).GetAtomicNum() for idx in range(3)] == [1, 6, 7]
 
+    def test_remove_h_matches_rdkit(self):
+        """Test that to_rdkit_mol with remove_h=True matches RDKit's RemoveHs, including molecules without hydrogens"""
+        from rdkit import Chem
+
+        mols = [
+            Molecule().from_smiles("O=C=O"),
+            Molecule().from_smiles("ClC(Cl)=C(Cl)Cl"),
+            Molecule().from_smiles("CCO"),
+            Molecule().from_adjacency_list(
+                """
+1 D u0 p0 c0 {2,S}
+2 D u0 p0 c0 {1,S}
+"""
+            ),
+            Molecule().from_adjacency_list(
+                """
+1 C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 D u0 p0 c0 {1,S}
+3 D u0 p0 c0 {1,S}
+4 D u0 p0 c0 {1,S}
+5 D u0 p0 c0 {1,S}
+"""
+            ),
+        ]
+        for mol in mols:
+            rdkitmol, rd_atom_indices = to_rdkit_mol(mol, remove_h=True, return_mapping=True)
+            expected = Chem.RemoveHs(to_rdkit_mol(mol, remove_h=False))
+
+            assert rdkitmol.GetNumAtoms() == expected.GetNumAtoms()
+            assert Chem.MolToSmiles(rdkitmol) == Chem.MolToSmiles(expected)
+            assert rd_atom_indices == {atom: i for i, atom in enumerate(mol.atoms) if atom.symbol != "H"}
+
 
 class ConverterTest:
     def setup_class(self):
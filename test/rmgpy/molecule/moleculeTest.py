@@ -75,6 +75,15 @@ class TestAtom:
         """
         assert self.atom.symbol == self.atom.element.symbol
 
+    def test_str(self):
+        """
+        Test the Atom string and repr output for radicals and charges.
+        """
+        assert str(self.atom) == "C."
+        assert repr(self.atom) == "<Atom 'C.'>"
+        assert str(Atom(element=get_element("N"), charge=1, lone_pairs=0)) == "N+"
+        assert str(Atom(element=get_element("O"), radical_electrons=2, charge=-2, lone_pairs=3)) == "O..--"
+
     def test_equality(self):
         """Test that we can perform equality comparison with Atom objects"""
         assert self.atom1 == self.atom1
@@ -1207,6 +1216,36 @@ multiplicity 2
         assert molecule1.is_isomorphic(molecule2, generate_initial_map=True)
         assert molecule2.is_isomorphic(molecule1, generate_initial_map=True)
 
+    def test_isomorphism_with_self(self):
+        """
+        Check that comparing a molecule to itself skips the isomorphism search
+        unless an initial map is generated from the atom labels.
+        """
+        molecule = Molecule().from_smiles("C=CC=C[CH]C")
+        molecule.atoms.reverse()
+        for atom in molecule.atoms:
+            atom.sorting_label = -1
+        atoms = list(molecule.atoms)
+        assert molecule.is_isomorphic(molecule)
+        assert molecule.is_isomorphic(molecule, strict=False)
+        # The isomorphism search would have sorted the atoms and assigned sorting labels
+        assert molecule.atoms == atoms
+        assert all(atom.sorting_label == -1 for atom in molecule.atoms)
+
+        # Duplicated labels on inequivalent atoms give an invalid initial map,
+        # so the labels must still be checked when comparing to itself
+        molecule = Molecule().from_adjacency_list(
+            """
+1 *1 C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 *1 O u0 p2 c0 {1,S} {6,S}
+3    H u0 p0 c0 {1,S}
+4    H u0 p0 c0 {1,S}
+5    H u0 p0 c0 {1,S}
+6    H u0 p0 c0 {2,S}"""
+        )
+        assert molecule.is_isomorphic(molecule)
+        assert not molecule.is_isomorphic(molecule, generate_initial_map=True)
+
     def test_subgraph_isomorphism(self):
         """
         Check the graph isomorphism functions.
@@ -2824,6 +2863,35 @@ multiplicity 2
         assert mol1.fingerprint == expected
         assert mol2.fingerprint == expected
 
+    def test_delete_hydrogens(self):
+        """
+        Test that delete_hydrogens removes only the unlabeled hydrogens and their bonds
+        """
+        mol = Molecule().from_adjacency_list(
+            """
+1    C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 *1 H u0 p0 c0 {1,S}
+3    H u0 p0 c0 {1,S}
+4    H u0 p0 c0 {1,S}
+5    O u0 p2 c0 {1,S} {6,S}
+6    H u0 p0 c0 {5,S}
+"""
+        )
+        assert mol.fingerprint == "C01H04N00O01S00"
+        mol.delete_hydrogens()
+        assert len(mol.atoms) == 3
+        assert mol.fingerprint == "C01H01N00O01S00"
+        carbon = [atom for atom in mol.atoms if atom.is_carbon()][0]
+        oxygen = [atom for atom in mol.atoms if atom.is_oxygen()][0]
+        assert len(carbon.bonds) == 2
+        assert len(oxygen.bonds) == 1
+        assert mol.get_labeled_atoms("*1")[0] in carbon.bonds
+
+        # A structure made only of hydrogens is left untouched
+        h2 = Molecule(smiles="[H][H]")
+        h2.delete_hydrogens()
+        assert len(h2.atoms) == 2
+
     def test_saturate_unfilled_valence(self):
         """
         Test the saturateUnfilledValence for an aromatic and nonaromatic case
@@ -2871,6 +2939,31 @@ multiplicity 2
         test.update()
         assert expected.is_isomorphic(test)
 
+    def test_saturate_unfilled_valence_resets_identifiers(self):
+        """
+        Test that saturate_unfilled_valence resets the cached fingerprint and SMILES
+        """
+        mol = Molecule(smiles="CCCC")
+        mol.delete_hydrogens()
+        assert mol.fingerprint == "C04H00N00O00S00"
+        smiles = mol.smiles
+        mol.saturate_unfilled_valence()
+        assert mol.fingerprint == "C04H10N00O00S00"
+        assert mol.smiles != smiles
+        assert mol.smiles == "CCCC"
+
+    def test_saturate_radicals_resets_identifiers(self):
+        """
+        Test that saturate_radicals resets the cached fingerprint and SMILES
+        """
+        mol = Molecule(smiles="[CH2]C")
+        assert mol.fingerprint == "C02H05N00O00S00"
+        smiles = mol.smiles
+        mol.saturate_radicals()
+        assert mol.fingerprint == "C02H06N00O00S00"
+        assert mol.smiles != smiles
+        assert mol.smiles == "CC"
+
     def test_get_element_count(self):
         """Test that we can count elements properly."""
         mol1 = Molecule(smiles="c1ccccc1")
@@ -552,6 +552,65 @@ Thermo library: primaryThermoLibrary
         assert not spc1.is_isomorphic(spc3, strict=True)
         assert not spc1.is_isomorphic(spc3, strict=False)
 
+    def test_is_isomorphic_different_formula(self):
+        """Test that species with different formulas are not isomorphic, regardless of resonance structures"""
+
+        class CountingMolecule(Molecule):
+            """Molecule that counts the calls to is_isomorphic"""
+            calls = 0
+
+            def is_isomorphic(self, *args, **kwargs):
+                CountingMolecule.calls += 1
+                return Molecule.is_isomorphic(self, *args, **kwargs)
+
+        spc1 = Species(molecule=[CountingMolecule(smiles="[CH2]C=C"), CountingMolecule(smiles="C=C[CH2]")])
+        spc2 = Species(smiles="[CH2]C=CC")
+        spc2.generate_resonance_structures()
+
+        assert not spc1.is_isomorphic(spc2)
+        assert not spc1.is_isomorphic(spc2.molecule[0])
+        # The formulas differ, so no pair of resonance structures is compared
+        assert CountingMolecule.calls == 0
+
+        # Same formula but a different structure still compares the structures
+        assert not spc1.is_isomorphic(Species(smiles="C=[C]C"))
+        assert CountingMolecule.calls > 0
+
+        assert spc1.is_isomorphic(spc1.molecule[-1])
+        assert not spc1.is_isomorphic(Species())
+
+    def test_is_isomorphic_self(self):
+        """Test that comparing a species to itself skips the isomorphism search unless a mapping is requested"""
+        spc = Species(smiles="[CH2]C=C")
+        spc.generate_resonance_structures()
+        orders = []
+        for mol in spc.molecule:
+            mol.atoms.reverse()
+            for atom in mol.atoms:
+                atom.sorting_label = -1
+            orders.append(list(mol.atoms))
+        assert spc.is_isomorphic(spc)
+        # The isomorphism search would have sorted the atoms and assigned sorting labels
+        assert [mol.atoms for mol in spc.molecule] == orders
+        assert all(atom.sorting_label == -1 for mol in spc.molecule for atom in mol.atoms)
+
+        empty = Species()
+        assert not empty.is_isomorphic(empty)
+
+        # Duplicated labels on inequivalent atoms give an invalid initial map,
+        # so the labels must still be checked when comparing to itself
+        spc = Species().from_adjacency_list(
+            """
+1 *1 C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 *1 O u0 p2 c0 {1,S} {6,S}
+3    H u0 p0 c0 {1,S}
+4    H u0 p0 c0 {1,S}
+5    H u0 p0 c0 {1,S}
+6    H u0 p0 c0 {2,S}"""
+        )
+        assert spc.is_isomorphic(spc)
+        assert not spc.is_isomorphic(spc, generate_initial_map=True)
+
     def test_species_label(self):
         """Test that the species label is not being assigned with the multiplicity string"""
         assert self.species3.label == ""